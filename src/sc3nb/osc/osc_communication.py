@@ -10,6 +10,7 @@ import copy
 import errno
 import logging
 import socket
+import struct
 import threading
 import time
 import traceback
@@ -22,7 +23,7 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import numpy as np
 from pythonosc.dispatcher import Dispatcher
 from pythonosc.osc_bundle import OscBundle
-from pythonosc.osc_bundle_builder import BuildError, OscBundleBuilder
+from pythonosc.osc_bundle_builder import BuildError
 from pythonosc.osc_message import OscMessage
 from pythonosc.osc_message_builder import OscMessageBuilder
 from pythonosc.osc_packet import OscPacket, ParseError
@@ -85,6 +86,57 @@ def split_into_max_size(bundler: "Bundler", max_dgram_size) -> List[OscBundle]:
     return splits
 
 
+_MAX_CACHED_PREFIXES = 1024
+_message_prefixes: Dict[Tuple[str, str], bytes] = {}
+
+
+def _build_simple_dgram(msg_address: str, msg_parameters: Sequence) -> Optional[bytes]:
+    """Build the datagram of an OSC message with str, int32 and float parameters.
+
+    The encoded address and type tags are cached for each message layout.
+
+    Parameters
+    ----------
+    msg_address : str
+        OSC message address
+    msg_parameters : Sequence
+        OSC message parameters
+
+    Returns
+    -------
+    bytes or None
+        datagram or None if a parameter of another type is used
+    """
+    type_tags = []
+    args = []
+    try:
+        for msg_arg in msg_parameters:
+            arg_type = type(msg_arg)
+            if arg_type is float:
+                type_tags.append("f")
+                args.append(struct.pack(">f", msg_arg))
+            elif arg_type is int and msg_arg.bit_length() <= 31:
+                type_tags.append("i")
+                args.append(struct.pack(">i", msg_arg))
+            elif arg_type is str:
+                type_tags.append("s")
+                encoded = msg_arg.encode("utf-8")
+                args.append(encoded + b"\x00" * (4 - len(encoded) % 4))
+            else:
+                return None
+    except (struct.error, OverflowError, UnicodeEncodeError):
+        return None
+    layout = (msg_address, "".join(type_tags))
+    prefix = _message_prefixes.get(layout)
+    if prefix is None:
+        prefix = osc_types.write_string(msg_address) + osc_types.write_string(
+            "," + layout[1]
+        )
+        if len(_message_prefixes) < _MAX_CACHED_PREFIXES:
+            _message_prefixes[layout] = prefix
+    return prefix + b"".join(args)
+
+
 class OSCMessage:
     """Class for creating messages to send over OSC
 
@@ -180,6 +232,10 @@ class OSCMessage:
         if not msg_address.startswith("/"):
             msg_address = "/" + msg_address
 
+        dgram = _build_simple_dgram(msg_address, msg_parameters)
+        if dgram is not None:
+            return OscMessage(dgram)
+
         builder = OscMessageBuilder(address=msg_address)
         for msg_arg in msg_parameters:
             if isinstance(msg_arg, np.number):
@@ -245,7 +301,7 @@ class Bundler:
     def dgram(self) -> bytes:
         # Bundler needs to be build, this ensures that
         # relative timings are calculated just now
-        return self.to_pythonosc().dgram
+        return self.to_raw_osc()
 
     def wait(self, time_passed: float) -> None:
         """Add time to internal time
@@ -393,10 +449,30 @@ class Bundler:
 
         Returns
         -------
-        OscBundle
-            bundle instance for sending
+        bytes
+            datagram of the bundle
         """
-        return self.to_pythonosc(start_time, delay).dgram
+        start_time = self._calc_timetag(start_time)
+        try:
+            parts = [
+                b"#bundle\x00",
+                osc_types.write_date(start_time + (delay if delay is not None else 0)),
+            ]
+            for content in self.contents:
+                if isinstance(content, Bundler):
+                    dgram = content.to_raw_osc(start_time=start_time, delay=delay)
+                elif isinstance(content, OSCMessage):
+                    dgram = content.dgram
+                else:
+                    raise ValueError(
+                        f"Couldn't build with unsupported content: {content}"
+                    )
+                parts.append(osc_types.write_int(len(dgram)))
+                parts.append(dgram)
+        except osc_types.BuildError as build_error:
+            raise BuildError("Could not build the bundle {}".format(build_error))
+        # join once instead of growing the datagram for each content
+        return b"".join(parts)
 
     def to_pythonosc(
         self, start_time: Optional[float] = None, delay: Optional[float] = None
@@ -415,20 +491,7 @@ class Bundler:
         OscBundle
             bundle instance for sending
         """
-        start_time = self._calc_timetag(start_time)
-        # build bundle
-        builder = OscBundleBuilder(start_time + (delay if delay is not None else 0))
-        # add contents
-        for content in self.contents:
-            if isinstance(content, Bundler):
-                builder.add_content(
-                    content.to_pythonosc(start_time=start_time, delay=delay)
-                )
-            elif isinstance(content, OSCMessage):
-                builder.add_content(content.to_pythonosc())
-            else:
-                ValueError("Couldn't build with unsupported content: {content}")
-        return builder.build()
+        return OscBundle(self.to_raw_osc(start_time, delay))
 
     def _calc_timetag(self, start_time: Optional[float]):
         if self.timetag > 1e6:
@@ -640,6 +703,24 @@ class MessageQueue(MessageHandler):
         self._queue.task_done()
         return val
 
+    def drain(self) -> List[Any]:
+        """Remove and return all values currently in the queue.
+
+        This does not block and takes the queue lock only once.
+
+        Returns
+        -------
+        List[Any]
+            values in the order they were received
+        """
+        with self._queue.mutex:
+            values = list(self._queue.queue)
+            self._queue.queue.clear()
+            if values:
+                self._queue.unfinished_tasks -= len(values)
+                self._queue.all_tasks_done.notify_all()
+        return values
+
     def show(self) -> None:
         """Print the content of the queue."""
         print(list(self._queue.queue))
@@ -682,14 +763,20 @@ class MessageQueueCollection(MessageHandler):
             first message address
         """
         subaddress, *args = args
-        if subaddress not in self.msg_queues:
-            self.msg_queues[subaddress] = MessageQueue(subaddress)
+        self._get_queue(subaddress).put(subaddress, *args)
+
+    def _get_queue(self, subaddress: str) -> MessageQueue:
+        """Get the MessageQueue of subaddress, create it if needed"""
+        msg_queue = self.msg_queues.get(subaddress)
+        if msg_queue is None:
+            # setdefault keeps the queue that was created first
+            msg_queue = self.msg_queues.setdefault(subaddress, MessageQueue(subaddress))
             _LOGGER.debug(
                 "MessageQueue for %s was created under MessageQueueCollection %s.",
                 subaddress,
                 self._address,
             )
-        self.msg_queues[subaddress].put(subaddress, *args)
+        return msg_queue
 
     @property
     def map_values(self) -> Tuple[str, Callable]:
@@ -706,7 +793,8 @@ class MessageQueueCollection(MessageHandler):
         return item in self.msg_queues
 
     def __getitem__(self, key):
-        return self.msg_queues[key]
+        # create the queue, so one can wait for the first message
+        return self._get_queue(key)
 
 
 class OSCCommunicationError(Exception):
@@ -985,17 +1073,16 @@ class OSCCommunication:
             receiver_address = self._default_receiver
 
         package = convert_to_sc3nb_osc(package)
+        # a Bundler builds its datagram on every access, so build it only once
+        dgram = package.dgram
         try:
-            sent_bytes = self._osc_server.socket.sendto(package.dgram, receiver_address)
+            sent_bytes = self._osc_server.socket.sendto(dgram, receiver_address)
         except OSError as error:
             if self._max_udp_packet_size is None:
                 self._max_udp_packet_size = get_max_udp_packet_size()
-            if (
-                isinstance(package, Bundler)
-                and len(package.dgram) > self._max_udp_packet_size
-            ):
+            if isinstance(package, Bundler) and len(dgram) > self._max_udp_packet_size:
                 _LOGGER.warning(
-                    f"OSC Bundle is too large ({len(package.dgram)}/{self._max_udp_packet_size}) and will be splitted."
+                    f"OSC Bundle is too large ({len(dgram)}/{self._max_udp_packet_size}) and will be splitted."
                 )
                 osc_bundles = split_into_max_size(package, self._max_udp_packet_size)
                 for osc_bundle in osc_bundles:
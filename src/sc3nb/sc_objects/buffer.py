@@ -283,6 +283,9 @@ class Buffer:
         self._samples = data.shape[0]
         self._channels = 1 if len(data.shape) == 1 else data.shape[1]
         if mode == "file":
+            if data.dtype.kind == "f" and data.dtype.itemsize > 4:
+                # scsynth stores float32 samples, no need to write more
+                data = data.astype(np.float32)
             tempfile = NamedTemporaryFile(delete=False)
             try:
                 wavfile.write(tempfile, self._sr, data)
@@ -854,18 +857,18 @@ class Buffer:
         """
         if not self._allocated:
             raise RuntimeError("Buffer object is not initialized!")
-        data = []
         blocksize = 1000  # array size compatible with OSC packet size
         i = 0
         num_samples = self._samples * self._channels
+        data = np.empty(num_samples)
         while i < num_samples:
             bs = blocksize if i + blocksize < num_samples else num_samples - i
             tmp = self._server.msg(
                 BufferCommand.GETN, [self._bufnum, i, bs], bundle=False
             )
-            data += list(tmp)[3:]  # skip first 3 els [bufnum, startidx, size]
+            data[i : i + bs] = tmp[3:]  # skip first 3 els [bufnum, startidx, size]
             i += bs
-        data = np.array(data).reshape((-1, self._channels))
+        data = data.reshape((-1, self._channels))
         return data
 
     # Section: Buffer information methods
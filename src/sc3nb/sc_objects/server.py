@@ -1,10 +1,10 @@
 """Module for managing Server related stuff."""
 import atexit
+import hashlib
 import logging
 import time
 import warnings
 from enum import Enum, unique
-from queue import Empty
 from random import randint
 from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Set, Tuple
 from weakref import WeakValueDictionary
@@ -30,7 +30,11 @@ from sc3nb.sc_objects.node import (
     NodeReply,
     SynthCommand,
 )
-from sc3nb.sc_objects.synthdef import SynthDef, SynthDefinitionCommand
+from sc3nb.sc_objects.synthdef import (
+    SynthDef,
+    SynthDefinitionCommand,
+    _synthdef_name,
+)
 from sc3nb.sc_objects.volume import Volume
 from sc3nb.util import is_socket_used
 
@@ -119,6 +123,24 @@ SCSYNTH_DEFAULT_PORT = 57110
 SC3_SERVER_NAME = "scsynth"
 
 
+class _ParamsPreview:
+    """Shortened str representation of OSC message parameters for logging.
+
+    The str is only created when the log record is emitted.
+    """
+
+    __slots__ = ("params",)
+
+    def __init__(self, params: Sequence[Any]) -> None:
+        self.params = params
+
+    def __str__(self) -> str:
+        params = str(self.params)
+        if len(params) > 55:
+            params = params[:55] + ".."
+        return params
+
+
 class ServerStatus(NamedTuple):
     """Information about the status of the Server program"""
 
@@ -346,6 +368,16 @@ class SCServer(OSCCommunication):
 
         self.latency: float = 0.0
 
+        self._log_repr_cache: Optional[str] = None
+
+        # digests of the SynthDefs sent to the server by name
+        self._sent_synthdefs: Dict[str, bytes] = {}
+
+        # last /status reply and when it was received
+        self._status_cache: Optional[ServerStatus] = None
+        self._status_fetched_at: float = 0.0
+        self.status_ttl_ms: float = 50
+
         self._init_osc_communication()
 
         # node managing
@@ -484,6 +516,10 @@ class SCServer(OSCCommunication):
             make a sound when initialized, by default True
         """
         self._init_osc_communication()
+        self._log_repr_cache = None
+        self._sent_synthdefs = {}
+        # the volume synth of a previous init is gone
+        self._volume._forget_synth()
 
         # notify the supercollider server about us
         self.add_receiver(
@@ -715,9 +751,11 @@ class SCServer(OSCCommunication):
         finally:
             super().quit()
             self._server_running = False
+            self._status_cache = None
             if self._is_local:
                 self._has_booted = False
                 self.process.kill()
+            self._log_repr_cache = None
             print("Done.")
 
     def sync(self, timeout=5) -> bool:
@@ -738,17 +776,57 @@ class SCServer(OSCCommunication):
         msg = OSCMessage(MasterControlCommand.SYNC, sync_id)
         return sync_id == self.send(msg, timeout=timeout, bundle=False)
 
-    def send_synthdef(self, synthdef_bytes: bytes):
+    def send_synthdef(
+        self,
+        synthdef_bytes: bytes,
+        await_reply: bool = True,
+        skip_known: bool = False,
+    ):
         """Send a SynthDef as bytes.
 
         Parameters
         ----------
         synthdef_bytes : bytes
             SynthDef bytes
-        wait : bool
-            If True wait for server reply.
+        await_reply : bool, optional
+            If True wait for server reply, by default True
+        skip_known : bool, optional
+            If True do not send the SynthDef again if this server already got
+            the very same SynthDef by send_synthdef since it was initialized.
+            Only use this if nothing else replaces the SynthDef on the server.
+            By default False
+        """
+        if self._bundling_bundles:
+            # bundled messages are sent later or not at all (e.g. for a Score)
+            SynthDef.send(
+                synthdef_bytes=synthdef_bytes, server=self, await_reply=await_reply
+            )
+            return
+        name = _synthdef_name(synthdef_bytes)
+        digest = hashlib.blake2b(synthdef_bytes, digest_size=16).digest()
+        if skip_known and name is not None and self._sent_synthdefs.get(name) == digest:
+            _LOGGER.debug("SynthDef %s is already known by %s", name, self)
+            return
+        SynthDef.send(
+            synthdef_bytes=synthdef_bytes, server=self, await_reply=await_reply
+        )
+        if name is not None:
+            self._sent_synthdefs[name] = digest
+
+    def forget_synthdef(self, name: Optional[str] = None) -> None:
+        """Forget that a SynthDef was sent to this server.
+
+        send_synthdef will send a forgotten SynthDef again.
+
+        Parameters
+        ----------
+        name : str, optional
+            SynthDef name, by default forget all SynthDefs
         """
-        SynthDef.send(synthdef_bytes=synthdef_bytes, server=self)
+        if name is None:
+            self._sent_synthdefs.clear()
+        else:
+            self._sent_synthdefs.pop(name, None)
 
     def load_synthdef(self, synthdef_path: str):
         """Load SynthDef file at path.
@@ -852,6 +930,8 @@ class SCServer(OSCCommunication):
         group.free_all()
         self.clear_schedule()
         if root:
+            # the volume synth was freed with the root node
+            self._volume._forget_synth()
             self.send_default_groups()
         else:
             self.default_group.new()
@@ -935,10 +1015,33 @@ class SCServer(OSCCommunication):
         msg = OSCMessage(MasterControlCommand.VERSION)
         return ServerVersion._make(self.send(msg, bundle=False))
 
-    def status(self) -> ServerStatus:
-        """Server status information"""
+    def status(self, ttl_ms: float = 0) -> ServerStatus:
+        """Server status information
+
+        Parameters
+        ----------
+        ttl_ms : float, optional
+            Reuse the last status reply if it is younger than ttl_ms milliseconds,
+            by default 0, i.e. always ask the server
+
+        Returns
+        -------
+        ServerStatus
+            status of the server
+        """
+        if (
+            self._status_cache is not None
+            and time.monotonic() - self._status_fetched_at < ttl_ms / 1000
+        ):
+            return self._status_cache
         msg = OSCMessage(MasterControlCommand.STATUS)
-        return ServerStatus._make(self.send(msg, bundle=False)[1:])
+        status = ServerStatus._make(self.send(msg, bundle=False)[1:])
+        self._status_cache = status
+        self._status_fetched_at = time.monotonic()
+        return status
+
+    def _cached_status(self) -> ServerStatus:
+        return self.status(ttl_ms=self.status_ttl_ms)
 
     def dump_osc(self, level: int = 1) -> None:
         """Enable dumping incoming OSC messages at the server process
@@ -999,42 +1102,42 @@ class SCServer(OSCCommunication):
     @property
     def peak_cpu(self) -> float:
         """Peak cpu usage of server process"""
-        return self.status().peak_cpu
+        return self._cached_status().peak_cpu
 
     @property
     def avg_cpu(self) -> float:
         """Average cpu usage of server process"""
-        return self.status().peak_cpu
+        return self._cached_status().avg_cpu
 
     @property
     def nominal_sr(self) -> float:
         """Nominal sample rate of server process"""
-        return self.status().nominal_sr
+        return self._cached_status().nominal_sr
 
     @property
     def actual_sr(self) -> float:
         """Actual sample rate of server process"""
-        return self.status().actual_sr
+        return self._cached_status().actual_sr
 
     @property
     def num_synths(self) -> int:
         """Number of Synths in server tree"""
-        return self.status().num_synths
+        return self._cached_status().num_synths
 
     @property
     def num_groups(self) -> int:
         """Number of Groups in server tree"""
-        return self.status().num_groups
+        return self._cached_status().num_groups
 
     @property
     def num_ugens(self) -> int:
         """Number of UGens in server tree"""
-        return self.status().num_ugens
+        return self._cached_status().num_ugens
 
     @property
     def num_synthdefs(self) -> int:
         """Number of SynthDefs known by server"""
-        return self.status().num_synthdefs
+        return self._cached_status().num_synthdefs
 
     @property
     def addr(self) -> Tuple[str, int]:
@@ -1055,7 +1158,7 @@ class SCServer(OSCCommunication):
     def unresponsive(self) -> bool:
         """If the server process is unresponsive"""
         try:
-            self.status()
+            self._cached_status()
         except OSCCommunicationError:
             return True
         else:
@@ -1108,31 +1211,29 @@ class SCServer(OSCCommunication):
         )
 
     def _get_errors_for_address(self, address: str):
-        error_values = []
         if address in self.fails:
-            while True:
-                try:
-                    error_values.append(self.fails.msg_queues[address].get(timeout=0))
-                except Empty:
-                    break
-        return error_values
+            return self.fails.msg_queues[address].drain()
+        return []
 
     def _log_repr(self):
-        pid = f" pid={self.pid}" if self.is_local else ""
-        return f"SCServer{self.addr}{pid}"
+        if self._log_repr_cache is None:
+            pid = f" pid={self.pid}" if self.is_local else ""
+            self._log_repr_cache = f"SCServer{self.addr}{pid}"
+        return self._log_repr_cache
 
     def _log_message(self, sender, *params):
-        params = str(params)
-        if len(params) > 55:
-            params = params[:55] + ".."
+        if not _LOGGER.isEnabledFor(logging.INFO):
+            return
         _LOGGER.info(
             "%s got OSC msg from %s: %s",
             self._log_repr(),
             self._check_sender(sender),
-            params,
+            _ParamsPreview(params),
         )
 
     def _warn_fail(self, sender, *params):
+        if not _LOGGER.isEnabledFor(logging.WARNING):
+            return
         warn_args = (self._log_repr(), self._check_sender(sender), params)
         now = time.time()
         last_time = self._warning_cache.get(warn_args, None)
@@ -1,11 +1,14 @@
 """Module to for using SuperCollider SynthDefs and Synths in Python"""
 
+import os
 import re
 import sys
+import time
 import warnings
 from enum import Enum, unique
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 if sys.version_info < (3, 9):
     # `importlib.resources` backported to PY<37 as `importlib_resources`.
@@ -16,6 +19,7 @@ else:
 
 import sc3nb
 import sc3nb.resources
+from sc3nb.osc.parsing import SYNTH_DEF_MARKER
 from sc3nb.util import parse_pyvars, replace_vars
 
 if TYPE_CHECKING:
@@ -24,6 +28,38 @@ if TYPE_CHECKING:
     from sc3nb.sclang import SCLang, SynthArgument
 
 
+_PLACEHOLDER_RE = re.compile(r"\{\{([^}]+)\}\}")
+
+
+def _synthdef_name(synthdef_bytes: bytes) -> Optional[str]:
+    """Get the name of the SynthDef in a SynthDef file blob.
+
+    Parameters
+    ----------
+    synthdef_bytes : bytes
+        SynthDef file content
+
+    Returns
+    -------
+    str or None
+        SynthDef name or None if the blob does not contain exactly one SynthDef
+    """
+    # file header: "SCgf", int32 version, int16 number of defs, pstring name
+    if synthdef_bytes[:4] != SYNTH_DEF_MARKER or len(synthdef_bytes) < 11:
+        return None
+    if int.from_bytes(synthdef_bytes[8:10], "big") != 1:
+        return None
+    name_length = synthdef_bytes[10]
+    return synthdef_bytes[11 : 11 + name_length].decode(errors="replace")
+
+
+def _server_or_default(server: Optional["SCServer"]) -> "SCServer":
+    """Return the provided server or the server of the default SC instance."""
+    if server is None:
+        return sc3nb.SC.get_default().server
+    return server
+
+
 @unique
 class SynthDefinitionCommand(str, Enum):
     """OSC Commands for Synth Definitions"""
@@ -40,6 +76,13 @@ class SynthDef:
     synth_descs = {}
     synth_defs = {}
 
+    unknown_desc_ttl: float = 5
+    """Seconds a failed SynthDesc lookup is remembered before sclang is asked again."""
+    _unknown_descs: Dict[str, float] = {}
+
+    direct_send_max: int = 8192
+    """Size in bytes above which SynthDefs are loaded from a file by local servers."""
+
     @classmethod
     def get_description(
         cls, name: str, lang: Optional["SCLang"] = None
@@ -58,6 +101,15 @@ class SynthDef:
         """
         if name in cls.synth_descs:
             return cls.synth_descs[name]
+        unknown_since = cls._unknown_descs.get(name)
+        if (
+            unknown_since is not None
+            and time.monotonic() - unknown_since < cls.unknown_desc_ttl
+        ):
+            warnings.warn(
+                f"SynthDesc '{name}' is unknown. sclang does not know this SynthDef"
+            )
+            return None
         synth_desc = None
         if lang is None:
             try:
@@ -68,6 +120,7 @@ class SynthDef:
         try:
             synth_desc = lang.get_synth_description(name)
         except ValueError:
+            cls._unknown_descs[name] = time.monotonic()
             warnings.warn(
                 f"SynthDesc '{name}' is unknown. sclang does not know this SynthDef"
             )
@@ -76,11 +129,37 @@ class SynthDef:
             cls.synth_descs[name] = synth_desc
         return synth_desc
 
+    @classmethod
+    def invalidate_descriptions(
+        cls, name: Optional[str] = None, only_unknown: bool = False
+    ) -> None:
+        """Forget cached Synth descriptions.
+
+        Parameters
+        ----------
+        name : str, optional
+            name of SynthDef, by default None, i.e. forget all descriptions
+        only_unknown : bool, optional
+            If True only forget that SynthDescs were unknown, by default False
+        """
+        if only_unknown:
+            if name is None:
+                cls._unknown_descs.clear()
+            else:
+                cls._unknown_descs.pop(name, None)
+        elif name is None:
+            cls.synth_descs.clear()
+            cls._unknown_descs.clear()
+        else:
+            cls.synth_descs.pop(name, None)
+            cls._unknown_descs.pop(name, None)
+
     @classmethod
     def send(
         cls,
         synthdef_bytes: bytes,
         server: Optional["SCServer"] = None,
+        await_reply: bool = True,
     ):
         """Send a SynthDef as bytes.
 
@@ -88,18 +167,40 @@ class SynthDef:
         ----------
         synthdef_bytes : bytes
             SynthDef bytes
-        wait : bool
-            If True wait for server reply.
         server : SCServer, optional
             Server instance that gets the SynthDefs,
             by default use the SC default server
+        await_reply : bool, optional
+            If True wait for the /done reply of the server, by default True
+
+        Notes
+        -----
+        A local server loads SynthDefs larger than `direct_send_max` bytes
+        from a temporary file using /d_load. This waits for the /done reply.
         """
-        if server is None:
-            server = sc3nb.SC.get_default().server
+        server = _server_or_default(server)
+        server.forget_synthdef(_synthdef_name(synthdef_bytes))
+        if (
+            len(synthdef_bytes) > cls.direct_send_max
+            and server.is_local
+            and not server._bundling_bundles
+        ):
+            # let the server read large SynthDefs from disk instead of a
+            # large /d_recv packet. We must wait for /done to remove the file.
+            tempfile = NamedTemporaryFile(suffix=".scsyndef", delete=False)
+            try:
+                tempfile.write(synthdef_bytes)
+            finally:
+                tempfile.close()
+            try:
+                server.msg(SynthDefinitionCommand.LOAD, tempfile.name, await_reply=True)
+            finally:
+                os.remove(tempfile.name)
+            return
         server.msg(
             SynthDefinitionCommand.RECV,
             synthdef_bytes,
-            await_reply=True,
+            await_reply=await_reply,
             bundle=True,
         )
 
@@ -119,8 +220,8 @@ class SynthDef:
             Server that gets the SynthDefs,
             by default use the SC default server
         """
-        if server is None:
-            server = sc3nb.SC.get_default().server
+        server = _server_or_default(server)
+        server.forget_synthdef()
         server.msg(
             SynthDefinitionCommand.LOAD,
             synthdef_path,
@@ -147,8 +248,8 @@ class SynthDef:
             Server that gets the SynthDefs,
             by default use the SC default server
         """
-        if server is None:
-            server = sc3nb.SC.get_default().server
+        server = _server_or_default(server)
+        server.forget_synthdef()
 
         def _load_synthdefs(path):
             cmd_args: List[Union[str, bytes]] = [path.as_posix()]
@@ -192,8 +293,27 @@ class SynthDef:
         self.sc = sc
         self.definition = definition
         self.name = name
+        # (searchpattern, value) of contexts not yet inserted into current_def
+        self._pending_contexts: List[Tuple[str, str]] = []
         self.current_def = definition
 
+    @property
+    def current_def(self) -> str:
+        """The definition with all contexts set so far"""
+        if self._pending_contexts:
+            # replace in order, a value may contain placeholders of later contexts
+            current_def = self._current_def
+            for searchpattern, value in self._pending_contexts:
+                current_def = current_def.replace("{{" + searchpattern + "}}", value)
+            self._current_def = current_def
+            self._pending_contexts = []
+        return self._current_def
+
+    @current_def.setter
+    def current_def(self, value: str) -> None:
+        self._current_def = value
+        self._pending_contexts = []
+
     def reset(self) -> "SynthDef":
         """Reset the current synthdef configuration to the self.definition value.
 
@@ -226,9 +346,7 @@ class SynthDef:
         self : object of type SynthDef
             the SynthDef object
         """
-        self.current_def = self.current_def.replace(
-            "{{" + searchpattern + "}}", str(value)
-        )
+        self._pending_contexts.append((searchpattern, str(value)))
         return self
 
     def set_contexts(self, dictionary: Dict[str, Any]) -> "SynthDef":
@@ -264,7 +382,7 @@ class SynthDef:
             the SynthDef object
 
         """
-        self.current_def = re.sub(r"{{[^}]+}}", "", self.current_def)
+        self.current_def = _PLACEHOLDER_RE.sub("", self.current_def)
         return self
 
     def add(
@@ -272,6 +390,7 @@ class SynthDef:
         pyvars=None,
         name: Optional[str] = None,
         server: Optional["SCServer"] = None,
+        skip_known: bool = False,
     ) -> str:
         """This method will add the current_def to SuperCollider.s
 
@@ -287,6 +406,9 @@ class SynthDef:
         server : SCServer, optional
             Server where this SynthDef will be send to,
             by default use the SC default server
+        skip_known : bool, optional
+            If True the server skips sending the SynthDef if it already got
+            the same SynthDef, see SCServer.send_synthdef, by default False
 
         Returns
         -------
@@ -296,11 +418,62 @@ class SynthDef:
         if name is not None:
             self.name = name
 
-        if self.name in SynthDef.synth_descs:
-            del SynthDef.synth_descs[self.name]
-
         if pyvars is None:
-            pyvars = sc3nb.sclang.parse_pyvars(self.current_def)
+            if "^" in self.current_def:
+                pyvars = sc3nb.sclang.parse_pyvars(self.current_def)
+            else:
+                pyvars = {}
+
+        synth_def_blob = self._create(pyvars)
+        if server is not None:
+            server.send_synthdef(synth_def_blob, skip_known=skip_known)
+        else:
+            self.sc.server.send_synthdef(synth_def_blob, skip_known=skip_known)
+        return self.name
+
+    @classmethod
+    def add_many(
+        cls,
+        synth_defs: Sequence["SynthDef"],
+        server: Optional["SCServer"] = None,
+    ) -> List[str]:
+        """Add multiple SynthDefs and wait only once for the server.
+
+        The SynthDefs are created by sclang one after another, but they are
+        sent without waiting for each /done reply. The server is synced once
+        at the end instead.
+
+        Parameters
+        ----------
+        synth_defs : Sequence[SynthDef]
+            SynthDefs to be added. Their pyvars are looked up from the caller.
+        server : SCServer, optional
+            Server where the SynthDefs will be send to,
+            by default use the server of the SC instance of each SynthDef
+
+        Returns
+        -------
+        List[str]
+            Names of the SynthDefs
+        """
+        servers: List["SCServer"] = []
+        for synth_def in synth_defs:
+            if "^" in synth_def.current_def:
+                pyvars = parse_pyvars(synth_def.current_def)
+            else:
+                pyvars = {}
+            synth_def_blob = synth_def._create(pyvars)
+            target = server if server is not None else synth_def.sc.server
+            target.send_synthdef(synth_def_blob, await_reply=False)
+            if target not in servers:
+                servers.append(target)
+        for target in servers:
+            target.sync()
+        return [synth_def.name for synth_def in synth_defs]
+
+    def _create(self, pyvars: dict) -> bytes:
+        """Create this SynthDef in sclang and return its bytes."""
+        SynthDef.invalidate_descriptions(self.name)
 
         # TODO should check if there is context/pyvars that can't be set
 
@@ -321,13 +494,8 @@ class SynthDef:
         if synth_def_blob == 0:
             print(output)
             raise RuntimeError(f"Adding SynthDef failed. - {output}")
-        else:
-            SynthDef.synth_defs[self.name] = synth_def_blob
-            if server is not None:
-                server.send_synthdef(synth_def_blob)
-            else:
-                self.sc.server.send_synthdef(synth_def_blob)
-            return self.name
+        SynthDef.synth_defs[self.name] = synth_def_blob
+        return synth_def_blob
 
     def free(self) -> "SynthDef":
         """Free this SynthDef from the server.
@@ -340,6 +508,7 @@ class SynthDef:
         if self.sc is None:
             self.sc = sc3nb.SC.get_default()
         self.sc.server.msg(SynthDefinitionCommand.FREE, [self.name], bundle=True)
+        self.sc.server.forget_synthdef(self.name)
         return self
 
     def __repr__(self):
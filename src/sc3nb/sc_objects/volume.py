@@ -22,19 +22,22 @@ class Volume:
 
     def __init__(self, server: "SCServer", min_: int = -90, max_: int = 6) -> None:
         self._server = server
-        self._server.add_init_hook(self.send__volume_synthdef)
-        self._server.add_init_hook(self.update_volume_synth)
+        self._server.add_init_hook(self._init_volume)
 
         self.min = min_
         self.max = max_
+        # amplitudes of the integer dB values in range
+        self._amp_table = {db: db_to_amp(db) for db in range(min_, max_ + 1)}
 
         self._muted = False
         self._volume = 0.0
         self._lag = 0.1
 
         self._synth_name: Optional[str] = None
+        self._warned_unknown_synthdef = False
 
         self._synth: Optional[Synth] = None
+        self._last_amp: Optional[float] = None
 
     @property
     def muted(self):
@@ -70,15 +73,22 @@ class Volume:
 
     def update_volume_synth(self) -> None:
         """Update volume Synth"""
-        amp = 0.0 if self._muted else db_to_amp(self._volume)
+        if self._muted:
+            amp = 0.0
+        else:
+            amp = self._amp_table.get(self._volume)
+            if amp is None:
+                amp = db_to_amp(self._volume)
         active = amp != 1.0
         if active:
             if self._server.is_running:
                 if self._synth is None:
                     if self._synth_name is None:
-                        warnings.warn(
-                            "Cannot set volume. Volume SynthDef unknown. Is the default sclang running?"
-                        )
+                        if not self._warned_unknown_synthdef:
+                            warnings.warn(
+                                "Cannot set volume. Volume SynthDef unknown. Is the default sclang running?"
+                            )
+                            self._warned_unknown_synthdef = True
                         return
                     controls = {
                         "volumeAmp": amp,
@@ -92,12 +102,27 @@ class Volume:
                         controls=controls,
                         server=self._server,
                     )
-                else:
+                elif amp != self._last_amp:
                     self._synth.set("volumeAmp", amp)
+                self._last_amp = amp
         else:
             if self._synth is not None:
                 self._synth.release()
                 self._synth = None
+            self._last_amp = None
+
+    def _forget_synth(self) -> None:
+        """Drop the volume Synth after the server freed all its nodes."""
+        self._synth = None
+        self._last_amp = None
+
+    def _init_volume(self) -> None:
+        """Send the Volume SynthDef and then update the volume Synth.
+
+        This is a single init hook as the init hooks are not ordered.
+        """
+        self.send__volume_synthdef()
+        self.update_volume_synth()
 
     def send__volume_synthdef(self):
         """Send Volume SynthDef"""
@@ -119,5 +144,7 @@ class Volume:
                     "Volume SynthDef cannot be send. No sclang receiver known."
                 )
             else:
-                self._synth_name = synth_def.add(server=self._server)
+                # the init hooks add the same SynthDef again and again
+                self._synth_name = synth_def.add(server=self._server, skip_known=True)
                 assert self._synth_name is not None, "Synth name is None"
+                self._warned_unknown_synthdef = False
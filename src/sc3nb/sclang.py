@@ -1,11 +1,12 @@
 """Module for handling a SuperCollider language (sclang) process."""
+import contextlib
 import logging
 import re
 import sys
 import warnings
-from pathlib import Path
+from pathlib import Path, PurePath
 from queue import Empty
-from typing import Any, NamedTuple, Optional, Sequence, Tuple
+from typing import Any, Iterator, NamedTuple, Optional, Sequence, Tuple
 
 if sys.version_info < (3, 9):
     # `importlib.resources` backported to PY<37 as `importlib_resources`.
@@ -17,7 +18,8 @@ else:
 import sc3nb.resources
 from sc3nb.process_handling import ALLOWED_PARENTS, Process, ProcessTimeout
 from sc3nb.sc_objects.server import ReplyAddress, SCServer
-from sc3nb.util import parse_pyvars, remove_comments, replace_vars
+from sc3nb.sc_objects.synthdef import SynthDef
+from sc3nb.util import SC_STRING_ESCAPES, parse_pyvars, replace_vars
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +27,74 @@ _LOGGER = logging.getLogger(__name__)
 SCLANG_DEFAULT_PORT = 57120
 SC3NB_SCLANG_CLIENT_ID = 0
 
+_WHITESPACE_RE = re.compile(r"\s+")
+# quoted strings with escapes | comments with the whitespace around them | whitespace
+_CLEANUP_RE = re.compile(
+    r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')"
+    r"|((?:\s*(?:/\*.*?\*/|//[^\r\n]*$))+\s*)|(\s+)",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+def _cleanup_replacer(match):
+    quoted = match.group(1)
+    if quoted is not None:
+        # the command must stay in one line, also inside of strings
+        return _WHITESPACE_RE.sub(" ", quoted)
+    return " "
+
+
+def _clean_code(code: str) -> str:
+    """Remove comments and unneeded whitespace from SuperCollider code."""
+    return _CLEANUP_RE.sub(_cleanup_replacer, code).strip()
+
+
+_RETURN_CALLBACK_CODE = _clean_code(
+    r"""
+    "sc3nb - Registering OSC /return callback".postln;
+    // NetAddr.useDoubles = true;
+    r = r ? ();
+    r.callback = { arg code, ip, port;
+        var result = code.interpret;
+        var addr = NetAddr.new(ip, port);
+        var prependSize = { arg elem;
+            if (elem.class == Array){
+                elem = [elem.size] ++ elem.collect(prependSize);
+            }{
+                elem;
+            };
+        };
+        var msgContent = prependSize.value(result);
+        addr.sendMsg("{{replyAddress}}", msgContent);
+        result;  // result should be returned
+    };"""
+).replace("{{replyAddress}}", ReplyAddress.RETURN_ADDR.value)
+_LOAD_SYNTHDEFS_CODE = _clean_code(
+    r"""
+    "sc3nb - Loading SynthDefs from {path}".postln;
+    PathName.new("{path}").files.collect(
+    {{ |path| (path.extension == "scsyndef").if({{SynthDescLib.global.read(path); path;}})}}
+    );"""
+)
+
+
+def _load_synthdefs_code(path: PurePath) -> str:
+    """SuperCollider code to load the SynthDef files in path into sclang."""
+    # the path is put into SuperCollider string literals
+    sc_path = path.as_posix().translate(SC_STRING_ESCAPES)
+    return _LOAD_SYNTHDEFS_CODE.format(path=sc_path)
+
+
+_SYNTH_DESC_CODE = _clean_code(
+    r"""
+    "sc3nb - Get SynthDesc of {synth_def}".postln;
+    SynthDescLib.global['{synth_def}'].notNil.if({{
+        SynthDescLib.global['{synth_def}'].controls.collect(
+            {{ | control | [control.name, control.rate, control.defaultValue] }}
+        )
+    }})"""
+)
+
 
 class SynthArgument(NamedTuple):
     """Synth argument, rate and default value"""
@@ -45,6 +115,8 @@ class SCLangError(Exception):
 class SCLang:
     """Class to control the SuperCollider Language Interpreter (sclang)."""
 
+    _default_synthdefs_path: Optional[Path] = None
+
     def __init__(self) -> None:
         """Creates a python representation of sclang.
 
@@ -127,32 +199,18 @@ class SCLang:
 
         This is done automatically by running start.
         """
-        print("Registering OSC /return callback in sclang... ", end="")
-        self.cmds(
-            r"""
-                "sc3nb - Registering OSC /return callback".postln;
-                // NetAddr.useDoubles = true;
-                r = r ? ();
-                r.callback = { arg code, ip, port;
-                    var result = code.interpret;
-                    var addr = NetAddr.new(ip, port);
-                    var prependSize = { arg elem;
-                        if (elem.class == Array){
-                            elem = [elem.size] ++ elem.collect(prependSize);
-                        }{
-                            elem;
-                        };
-                    };
-                    var msgContent = prependSize.value(result);
-                    addr.sendMsg(^replyAddress, msgContent);
-                    result;  // result should be returned
-                };""",
-            pyvars={"replyAddress": ReplyAddress.RETURN_ADDR},
+        print(
+            "Registering OSC /return callback and loading default sc3nb SynthDefs... ",
+            end="",
         )
-        print("Done.")
-
-        print("Loading default sc3nb SynthDefs... ", end="")
-        self.load_synthdefs()
+        # register the callback and load the SynthDefs with a single command
+        with self._synthdefs_dir() as path:
+            self.cmds(
+                _RETURN_CALLBACK_CODE + " " + _load_synthdefs_code(path),
+                pyvars={},
+            )
+        # the loaded SynthDefs may replace known ones
+        SynthDef.invalidate_descriptions()
         print("Done.")
 
     def load_synthdefs(self, synthdefs_path: Optional[str] = None) -> None:
@@ -164,26 +222,48 @@ class SCLang:
             Path where the SynthDef files are located.
             If no path provided, load default sc3nb SynthDefs.
         """
-
         # TODO could also extract SynthDefs from sccode/write_synthdefs.scd here
         # re.findall(r'SynthDef\("(.*?)",(.*?)\)\.writeDefFile', content, re.DOTALL)
-        def _load_synthdef(path):
-            self.cmds(
-                r""" "sc3nb - Loading SynthDefs from ^synthdef_path".postln;
-                PathName.new(^synthdefs_path).files.collect(
-                { |path| (path.extension == "scsyndef").if({SynthDescLib.global.read(path); path;})}
-                );""",
-                pyvars={"synthdefs_path": path.as_posix()},
-            )
+        with self._synthdefs_dir(synthdefs_path) as path:
+            self.cmds(_load_synthdefs_code(path), pyvars={})
+        # the loaded SynthDefs may replace known ones
+        SynthDef.invalidate_descriptions()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _synthdefs_dir(synthdefs_path: Optional[str] = None) -> Iterator[Path]:
+        """Provide the directory of the SynthDef files.
 
+        Parameters
+        ----------
+        synthdefs_path : str, optional
+            Path where the SynthDef files are located.
+            If no path provided, use the default sc3nb SynthDefs.
+
+        Yields
+        ------
+        Path
+            directory with the SynthDef files
+
+        Raises
+        ------
+        ValueError
+            If the provided path is not a directory.
+        """
         if synthdefs_path is None:
-            ref = libresources.files(sc3nb.resources) / "synthdefs"
-            with libresources.as_file(ref) as path:
-                _load_synthdef(path)
+            if SCLang._default_synthdefs_path is not None:
+                yield SCLang._default_synthdefs_path
+            else:
+                ref = libresources.files(sc3nb.resources) / "synthdefs"
+                if isinstance(ref, Path):
+                    # only a path on disk stays valid after as_file
+                    SCLang._default_synthdefs_path = ref
+                with libresources.as_file(ref) as path:
+                    yield path
         else:
             path = Path(synthdefs_path)
             if path.exists() and path.is_dir():
-                _load_synthdef(path)
+                yield path
             else:
                 raise ValueError(f"Provided path {path} does not exist or is not a dir")
 
@@ -198,7 +278,7 @@ class SCLang:
         print("Exiting sclang... ", end="")
         self.started = False
         try:
-            self.cmds('"sc3nb - exiting sclang".postln; 0.exit;')
+            self.cmds('"sc3nb - exiting sclang".postln; 0.exit;', pyvars={})
         except RuntimeError:
             pass
         else:
@@ -279,34 +359,43 @@ class SCLang:
         code = replace_vars(code, pyvars)
 
         # cleanup command string
-        code = remove_comments(code)
-        code = re.sub(r"\s+", " ", code).strip()
+        code = _clean_code(code)
 
+        if "SynthDef" in code:
+            # the code may define SynthDefs that were unknown before
+            SynthDef.invalidate_descriptions(only_unknown=True)
+
+        server = self._server
         if get_result:
-            if self._server is None:
+            if server is None:
                 raise RuntimeError(
                     "get_result is only possible when connected to a SCServer"
                 )
             # escape " and \ in our SuperCollider string literal
-            inner_code_escapes = str.maketrans({ord("\\"): r"\\", ord('"'): r"\""})
-            inner_code = code.translate(inner_code_escapes)
+            inner_code = code.translate(SC_STRING_ESCAPES)
             # wrap the command string with our callback function
-            code = r"""r['callback'].value("{0}", "{1}", {2});""".format(
-                inner_code, *self._server.osc_server.server_address
-            )
+            # read each time, a server init can move the OSC server to another port
+            ip, port = server.osc_server.server_address
+            code = f"""r['callback'].value("{inner_code}", "{ip}", {port});"""
 
         if discard_output:
             self.empty()  # clean all past outputs
+            if get_result:
+                # a late /return of a timed out command is not our result
+                stale_returns = server.returns.drain()
+                if stale_returns:
+                    _LOGGER.debug("Discarded stale /return values %s", stale_returns)
 
         # write command to sclang pipe \f
+        ending = self.ending
         if code and code[-1] != ";":
-            code += ";"
-        self.process.write(code + self.ending)
+            ending = ";" + ending
+        self.process.write(code + ending)
 
         return_val = None
         if get_result:
             try:
-                return_val = self._server.returns.get(timeout)
+                return_val = server.returns.get(timeout)
             except Empty as empty_exception:
                 out = self.read()
                 if print_error:
@@ -325,23 +414,53 @@ class SCLang:
             return_val = (return_val, out) if get_result else out
         return return_val
 
-    def cmdv(self, code: str, **kwargs) -> Any:
-        """cmd with verbose=True"""
+    def cmd_batch(self, codes: Sequence[str], **kwargs) -> Any:
+        """cmd for several code snippets that are sent as a single command.
+
+        The snippets are joined into one line so that sclang is only written to
+        and waited for once.
+
+        Parameters
+        ----------
+        codes : Sequence[str]
+            SuperCollider code snippets to execute in order.
+        kwargs : Any, optional
+            Keyword arguments for cmd
+
+        Returns
+        -------
+        Any
+            see cmd, the result is the result of the last snippet.
+        """
+        snippets = []
+        for code in codes:
+            code = _clean_code(code)
+            if code and code[-1] != ";":
+                code += ";"
+            snippets.append(code)
+        code = " ".join(snippets)
         if kwargs.get("pyvars", None) is None:
             kwargs["pyvars"] = parse_pyvars(code)
-        return self.cmd(code, verbose=True, **kwargs)
+        return self.cmd(code, **kwargs)
+
+    def cmdv(self, code: str, **kwargs) -> Any:
+        """cmd with verbose=True"""
+        return self._cmd_wrapped(code, kwargs, verbose=True)
 
     def cmds(self, code: str, **kwargs) -> Any:
         """cmd with verbose=False, i.e. silent"""
-        if kwargs.get("pyvars", None) is None:
-            kwargs["pyvars"] = parse_pyvars(code)
-        return self.cmd(code, verbose=False, **kwargs)
+        return self._cmd_wrapped(code, kwargs, verbose=False)
 
     def cmdg(self, code: str, **kwargs) -> Any:
         """cmd with get_result=True"""
+        return self._cmd_wrapped(code, kwargs, get_result=True)
+
+    def _cmd_wrapped(self, code: str, kwargs: dict, **cmd_kwargs) -> Any:
+        """cmd for the wrappers, pyvars are searched from the wrappers caller on."""
         if kwargs.get("pyvars", None) is None:
-            kwargs["pyvars"] = parse_pyvars(code)
-        return self.cmd(code, get_result=True, **kwargs)
+            # frames: parse_pyvars, _cmd_wrapped, wrapper, caller of wrapper
+            kwargs["pyvars"] = parse_pyvars(code, frame_nr=3)
+        return self.cmd(code, **cmd_kwargs, **kwargs)
 
     def read(
         self, expect: Optional[str] = None, timeout: float = 1, print_error: bool = True
@@ -405,19 +524,19 @@ class SCLang:
         ValueError
             When SynthDesc of synth_def can not be found.
         """
-        code = r""" "sc3nb - Get SynthDesc of {{synthDef}}".postln;
-                SynthDescLib.global['{{synthDef}}'].notNil.if({
-                    SynthDescLib.global['{{synthDef}}'].controls.collect(
-                        { | control | [control.name, control.rate, control.defaultValue] }
-                    )
-                })""".replace(
-            "{{synthDef}}", synth_def
-        )
-        synth_desc = self.cmds(code, get_result=True, print_error=False)
+        code = _SYNTH_DESC_CODE.format(synth_def=synth_def)
+        synth_desc = self.cmds(code, pyvars={}, get_result=True, print_error=False)
         if synth_desc:
-            return {
-                s[0]: SynthArgument(s[0], *s[1:]) for s in synth_desc if s[0] != "?"
-            }
+            synth_args = {}
+            for arg_name, rate, default in synth_desc:
+                if arg_name == "?":
+                    continue
+                # the same names and rates are shared by many SynthDescs
+                arg_name = sys.intern(arg_name)
+                synth_args[arg_name] = SynthArgument(
+                    arg_name, sys.intern(rate), default
+                )
+            return synth_args
         else:
             raise ValueError(f"Synth Desc of synth_def '{synth_def}' cannot be found")
 
@@ -452,17 +571,18 @@ class SCLang:
             server = self._server
         if not isinstance(server, SCServer):
             raise ValueError(f"Server must be instance of SCServer, got {type(server)}")
-        code = r""" "sc3nb - Connecting sclang to scsynth".postln;
-        Server.default=s=Server.remote('sc3nb_remote', NetAddr("{0}",{1}), options:ServerOptions.new, clientID:{2});"""
-        self.cmds(code.format(*server.addr, SC3NB_SCLANG_CLIENT_ID))
+        ip, port = server.addr
+        code = f""" "sc3nb - Connecting sclang to scsynth".postln;
+        Server.default=s=Server.remote('sc3nb_remote', NetAddr("{ip}",{port}), options:ServerOptions.new, clientID:{SC3NB_SCLANG_CLIENT_ID});"""
+        self.cmds(code, pyvars={})
         try:  # if there are 'too many users' we failed. So the Exception is the successful case!
             self.read(expect="too many users", timeout=0.3, print_error=False)
         except ProcessTimeout:
             self._server = server
-            self._port = self.cmdg("NetAddr.langPort", verbose=False)
+            self._port = self.cmdg("NetAddr.langPort", pyvars={}, verbose=False)
             _LOGGER.info("Connecting %s with %s", self._server, self)
             self._server.connect_sclang(port=self._port)
-            self._server.add_init_hook(self.cmds, "s.initTree;")
+            self._server.add_init_hook(self.cmds, "s.initTree;", pyvars={})
         else:
             raise SCLangError(
                 "failed to register to the server (too many users)\n"
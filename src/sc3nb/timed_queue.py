@@ -1,11 +1,11 @@
 """Classes to run register functions at certain timepoints and run asynchronously"""
 
+import heapq
+import itertools
 import threading
 import time
 from typing import Any, Callable, Iterable, NoReturn, Union
 
-import numpy as np
-
 import sc3nb
 from sc3nb.osc.osc_communication import Bundler, OSCCommunication, OSCMessage
 
@@ -68,7 +68,7 @@ class TimedQueue:
     relative_time : bool, optional
         If True, use relative time, by default False
     thread_sleep_time : float, optional
-        Sleep time in seconds for worker thread, by default 0.001
+        Not used anymore, the worker thread waits for the next event.
     drop_time_threshold : float, optional
         Threshold for execution time of events in seconds.
         If this is exceeded the event will be dropped, by default 0.5
@@ -82,14 +82,21 @@ class TimedQueue:
     ) -> None:
         self.drop_time_thr = drop_time_threshold
         self.start = time.time() if relative_time else 0
-        self.onset_idx = np.empty((0, 2))
+        # heap of (timestamp, insertion number, event) entries, the insertion
+        # number keeps events with equal timestamps in order of insertion
         self.event_list = []
+        self._event_counter = itertools.count()
         self.close_event = threading.Event()
 
         self.lock = threading.Lock()
+        # notified when the events or the queue time changed
+        self.cond = threading.Condition(self.lock)
+        # notified when the worker ran out of events
+        self._idle_cond = threading.Condition(self.lock)
+        self._executing = False
 
         self.thread = threading.Thread(
-            target=self.__worker, args=(thread_sleep_time, self.close_event)
+            target=self.__worker, args=(self.close_event,)
         )  # , daemon=True)
 
         self.thread.start()
@@ -97,18 +104,23 @@ class TimedQueue:
     def close(self) -> None:
         """Closes event processing without waiting for pending events"""
         self.close_event.set()
+        with self.cond:
+            self.cond.notify_all()
+            self._idle_cond.notify_all()
         self.thread.join()
 
     def join(self) -> None:
         """Closes event processing after waiting for pending events"""
         self.complete()
-        self.close_event.set()
-        self.thread.join()
+        self.close()
 
     def complete(self) -> None:
         """Blocks until all pending events have completed"""
-        while self.event_list:
-            time.sleep(0.01)
+        with self._idle_cond:
+            self._idle_cond.wait_for(
+                lambda: self.close_event.is_set()
+                or not (self.event_list or self._executing)
+            )
 
     def put(
         self,
@@ -140,17 +152,25 @@ class TimedQueue:
             raise TypeError("function argument cannot be called")
         if not isinstance(args, tuple):
             args = (args,)
-        new_event = Event(timestamp, function, args, spawn)
-        with self.lock:
-            self.event_list.append(new_event)
-            evlen = len(self.event_list)
-            if not self.onset_idx.any():
-                idx = 0
-            else:
-                idx = np.searchsorted(self.onset_idx[:, 0], timestamp)
-            self.onset_idx = np.insert(
-                self.onset_idx, idx, [timestamp, evlen - 1], axis=0
+        self._put_event(Event(timestamp, function, args, spawn))
+
+    def _put_event(self, event: Event) -> None:
+        """Adds an already checked event to queue"""
+        with self.cond:
+            heapq.heappush(
+                self.event_list, (event.timestamp, next(self._event_counter), event)
             )
+            self.cond.notify()
+
+    def _put_events(self, events: Iterable[Event]) -> None:
+        """Adds already checked events to queue"""
+        with self.cond:
+            for event in events:
+                heapq.heappush(
+                    self.event_list,
+                    (event.timestamp, next(self._event_counter), event),
+                )
+            self.cond.notify()
 
     def get(self) -> Event:
         """Get latest event from queue and remove event
@@ -160,9 +180,8 @@ class TimedQueue:
         Event
             Latest event
         """
-        event = self.peek()
-        self.pop()
-        return event
+        with self.lock:
+            return heapq.heappop(self.event_list)[2]
 
     def peek(self) -> Event:
         """Look up latest event from queue
@@ -173,7 +192,7 @@ class TimedQueue:
             Latest event
         """
         with self.lock:
-            return self.event_list[int(self.onset_idx[0][1])]
+            return self.event_list[0][2]
 
     def empty(self) -> bool:
         """Checks if queue is empty
@@ -184,34 +203,38 @@ class TimedQueue:
             True if queue if empty
         """
         with self.lock:
-            return bool(self.event_list)
+            return not self.event_list
 
     def pop(self) -> None:
         """Removes latest event from queue"""
         with self.lock:
-            event_idx = int(self.onset_idx[0][1])
-            self.onset_idx = self.onset_idx[1:]
-            # remove 1 from all idcs after popped event
-            self.onset_idx[:, 1][self.onset_idx[:, 1] > event_idx] -= 1
-            del self.event_list[event_idx]
+            heapq.heappop(self.event_list)
 
-    def __worker(self, sleep_time: float, close_event: threading.Event) -> NoReturn:
+    def __worker(self, close_event: threading.Event) -> NoReturn:
         """Worker function to process events"""
         while True:
-            if close_event.is_set():
-                break
-            if self.event_list:
-                event = self.peek()
-                if event.timestamp <= time.time() - self.start:
-                    # execute only if not too old
-                    if event.timestamp > time.time() - self.start - self.drop_time_thr:
-                        event.execute()
-                    self.pop()
-                # sleep_time = event_list[0].timestamp - (time.time() - self.start) - 0.001
-            time.sleep(sleep_time)
+            with self.cond:
+                self._executing = False
+                while not close_event.is_set():
+                    if not self.event_list:
+                        self._idle_cond.notify_all()
+                        self.cond.wait()
+                        continue
+                    delay = self.event_list[0][0] - (time.time() - self.start)
+                    if delay <= 0:
+                        break
+                    self.cond.wait(timeout=delay)
+                if close_event.is_set():
+                    break
+                event = heapq.heappop(self.event_list)[2]
+                self._executing = True
+            # execute only if not too old
+            if event.timestamp > time.time() - self.start - self.drop_time_thr:
+                event.execute()
 
     def __repr__(self):
-        return f"<TimedQueue {self.event_list.__repr__()}>"
+        events = [entry[2] for entry in sorted(self.event_list)]
+        return f"<TimedQueue {events.__repr__()}>"
 
     def elapse(self, time_delta: float) -> None:
         """Add time delta to the current queue time.
@@ -221,7 +244,9 @@ class TimedQueue:
         time_delta : float
             Additional time
         """
-        self.start += time_delta
+        with self.cond:
+            self.start += time_delta
+            self.cond.notify()
 
 
 class TimedQueueSC(TimedQueue):
@@ -234,7 +259,7 @@ class TimedQueueSC(TimedQueue):
     relative_time : bool, optional
         If True, use relative time, by default False
     thread_sleep_time : float, optional
-        Sleep time in seconds for worker thread, by default 0.001
+        Not used anymore, the worker thread waits for the next event.
     """
 
     def __init__(
@@ -256,7 +281,20 @@ class TimedQueueSC(TimedQueue):
         bundler : Bundler
             Bundler that will be sent
         """
-        self.put(onset, bundler.send)
+        self._put_event(Event(onset, bundler.send, ()))
+
+    def put_bundler_many(self, onsets: Iterable[float], bundler: Bundler) -> None:
+        """Add a Bundler to queue for each of the onsets
+
+        Parameters
+        ----------
+        onsets : Iterable[float]
+            Sending timetags of the Bundler
+        bundler : Bundler
+            Bundler that will be sent
+        """
+        send = bundler.send
+        self._put_events(Event(onset, send, ()) for onset in onsets)
 
     def put_msg(
         self, onset: float, msg: Union[OSCMessage, str], msg_params: Iterable[Any]
@@ -273,6 +311,6 @@ class TimedQueueSC(TimedQueue):
             If msg is str, this will be the parameters of the created OSCMessage
         """
         if isinstance(msg, str):
-            self.put(onset, self.server.msg, args=(msg, msg_params))
+            self._put_event(Event(onset, self.server.msg, (msg, msg_params)))
         else:
-            self.put(onset, self.server.send, args=(msg,))
+            self._put_event(Event(onset, self.server.send, (msg,)))
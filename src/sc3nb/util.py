@@ -1,8 +1,8 @@
 """Module with utlilty functions - especially for handling code snippets"""
-import inspect
 import re
 import socket
-from typing import Any
+import sys
+from typing import Any, Callable, Dict
 
 import numpy as np
 
@@ -19,6 +19,28 @@ def is_socket_used(addr=("127.0.0.1", 57110)):
         a_socket.close()
 
 
+# function code by Onur Yildirim (https://stackoverflow.com/a/18381470)
+# first group captures quoted strings (double or single)
+# second group captures comments (//single-line or /* multi-line */)
+# the quoted strings may contain escaped quotes
+_COMMENT_RE = re.compile(
+    r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|(/\*.*?\*/|//[^\r\n]*$)",
+    re.MULTILINE | re.DOTALL,
+)
+_PYVAR_RE = re.compile(r"\^([A-Za-z_]\w*)")
+# escape " and \ in SuperCollider string literals
+SC_STRING_ESCAPES = str.maketrans({ord("\\"): r"\\", ord('"'): r"\""})
+
+
+def _comment_replacer(match):
+    # if the 2nd group (capturing comments) is not None,
+    # it means we have captured a non-quoted (real) comment string.
+    if match.group(2) is not None:
+        return ""  # so we will return empty to remove the comment
+    else:  # otherwise, we will return the 1st group
+        return match.group(1)  # captured quoted-string
+
+
 def remove_comments(code: str) -> str:
     """Removes all c-style comments from code.
 
@@ -34,23 +56,9 @@ def remove_comments(code: str) -> str:
     str
         code string without comments
     """
-    # function code by Onur Yildirim (https://stackoverflow.com/a/18381470)
-    # first group captures quoted strings (double or single)
-    # second group captures comments (//single-line or /* multi-line */)
-    # alternative cares for escaped quotes
-    # pattern = r"(\".*?(?<!\\)\"|\'.*?(?<!\\)\')|(/\*.*?\*/|//[^\r\n]*$)"
-    pattern = r"(\".*?\"|\'.*?\')|(/\*.*?\*/|//[^\r\n]*$)"
-    regex = re.compile(pattern, re.MULTILINE | re.DOTALL)
-
-    def _replacer(match):
-        # if the 2nd group (capturing comments) is not None,
-        # it means we have captured a non-quoted (real) comment string.
-        if match.group(2) is not None:
-            return ""  # so we will return empty to remove the comment
-        else:  # otherwise, we will return the 1st group
-            return match.group(1)  # captured quoted-string
-
-    return regex.sub(_replacer, code)
+    if "//" not in code and "/*" not in code:
+        return code
+    return _COMMENT_RE.sub(_comment_replacer, code)
 
 
 def parse_pyvars(code: str, frame_nr: int = 2):
@@ -73,32 +81,30 @@ def parse_pyvars(code: str, frame_nr: int = 2):
     NameError
         If the variable value could not be found.
     """
-    matches = re.findall(r"\s*\^[A-Za-z_]\w*\s*", code)
-
-    pyvars = {match.split("^")[1].strip(): None for match in matches}
-    missing_vars = list(pyvars.keys())
+    if "^" not in code:
+        return {}
+    pyvars = dict.fromkeys(_PYVAR_RE.findall(code))
+    missing_vars = set(pyvars)
 
-    stack = inspect.stack()
-    frame = None
     try:
-        while missing_vars and frame_nr < len(stack):
-            frame = stack[frame_nr][0]
-            for pyvar in pyvars:
-                if pyvar not in missing_vars:
-                    continue
-                # check for variable in local variables
-                if pyvar in frame.f_locals:
-                    pyvars[pyvar] = frame.f_locals[pyvar]
-                    missing_vars.remove(pyvar)
-                # check for variable in global variables
-                elif pyvar in frame.f_globals:
-                    pyvars[pyvar] = frame.f_globals[pyvar]
-                    missing_vars.remove(pyvar)
-            frame_nr += 1
+        frame = sys._getframe(frame_nr) if missing_vars else None
+    except ValueError:  # call stack is not deep enough
+        frame = None
+    try:
+        while missing_vars and frame is not None:
+            # local variables take precedence over global variables
+            for namespace in (frame.f_locals, frame.f_globals):
+                # no dict views here, f_locals is not a dict in every Python
+                found_vars = [pyvar for pyvar in missing_vars if pyvar in namespace]
+                for pyvar in found_vars:
+                    pyvars[pyvar] = namespace[pyvar]
+                missing_vars.difference_update(found_vars)
+            frame = frame.f_back
     finally:
         del frame
-        del stack
+        namespace = None
     if missing_vars:
+        missing_vars = [pyvar for pyvar in pyvars if pyvar in missing_vars]
         raise NameError("name(s) {} not defined".format(missing_vars))
     return pyvars
 
@@ -121,11 +127,19 @@ def replace_vars(code: str, pyvars: dict) -> str:
     str
         Code with injected variables.
     """
-    for pyvar, value in pyvars.items():
-        pyvar = "^" + pyvar
-        value = convert_to_sc(value)
-        code = code.replace(pyvar, value)
-    return code
+    if not pyvars:
+        return code
+    sc_values = {}
+
+    def _replacer(match):
+        pyvar = match.group(1)
+        if pyvar not in pyvars:
+            return match.group(0)
+        if pyvar not in sc_values:
+            sc_values[pyvar] = convert_to_sc(pyvars[pyvar])
+        return sc_values[pyvar]
+
+    return _PYVAR_RE.sub(_replacer, code)
 
 
 def convert_to_sc(obj: Any) -> str:
@@ -137,7 +151,7 @@ def convert_to_sc(obj: Any) -> str:
     * complex type -> SC Complex
     * strings -> if starting with sc3: it will be used as SC code
                  if it starts with a \\ (single escaped backward slash) it will be used as symbol
-                 else it will be inserted as string
+                 else it will be inserted as string with escaped " and \\
 
     For unsupported types the __repr__ will be used.
 
@@ -151,17 +165,43 @@ def convert_to_sc(obj: Any) -> str:
     str
         SuperCollider Code literal
     """
+    converter = _SC_CONVERTERS.get(type(obj))
+    if converter is not None:
+        return converter(obj)
+    # subclasses of the supported types
     if isinstance(obj, np.ndarray):
-        return obj.tolist().__repr__()
+        return _ndarray_to_sc(obj)
     if isinstance(obj, complex):
-        return "Complex({0}, {1})".format(obj.real, obj.imag)
+        return _complex_to_sc(obj)
     if isinstance(obj, str):
-        if obj.startswith("sc3:"):  # start sequence for sc3-code
-            return "{}".format(obj[4:])
-        if obj.startswith(r"\\") and not obj.startswith(r"\\\\"):
-            return "'{}'".format(obj[1:])  # 'x' will be interpreted as symbol
-        if obj.startswith(r"\\\\"):
-            obj = obj[1:]
-        return '"{}"'.format(obj)  # "x" will be interpreted as string
+        return _str_to_sc(obj)
     # further type conversion can be added in the future
     return obj.__repr__()
+
+
+def _ndarray_to_sc(obj: np.ndarray) -> str:
+    return obj.tolist().__repr__()
+
+
+def _complex_to_sc(obj: complex) -> str:
+    return f"Complex({obj.real}, {obj.imag})"
+
+
+def _str_to_sc(obj: str) -> str:
+    if obj.startswith("sc3:"):  # start sequence for sc3-code
+        return obj[4:]
+    if obj.startswith(r"\\"):
+        if not obj.startswith(r"\\\\"):
+            return f"'{obj[1:]}'"  # 'x' will be interpreted as symbol
+        obj = obj[1:]
+    # "x" will be interpreted as string
+    return f'"{obj.translate(SC_STRING_ESCAPES)}"'
+
+
+_SC_CONVERTERS: Dict[type, Callable[[Any], str]] = {
+    np.ndarray: _ndarray_to_sc,
+    complex: _complex_to_sc,
+    str: _str_to_sc,
+    int: repr,
+    float: repr,
+}
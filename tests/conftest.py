@@ -1,11 +1,11 @@
 import logging
-from pathlib import Path
 from random import randrange
+from typing import Optional
 from unittest import TestCase
 
 import pytest
 
-from sc3nb.sc import startup
+from sc3nb.sc import SC, startup
 from sc3nb.sc_objects.server import ServerOptions
 
 
@@ -18,7 +18,7 @@ def no_logs_gte_error(caplog, request):
         record
         for record in caplog.get_records("call")
         if record.levelno >= logging.WARNING
-        and "pythonosc/osc_bundle.py" not in Path(record.pathname).as_posix()
+        and "pythonosc/osc_bundle.py" not in record.pathname.replace("\\", "/")
     ]
     formatter = logging.Formatter("%(name)s:%(lineno)d  %(levelname)s - %(message)s")
     assert (
@@ -32,25 +32,63 @@ def pytest_configure(config):
     )
 
 
-class SCBaseTest(TestCase):
-    __test__ = False
-    sc = None
-    start_sclang = False
+_shared_sc: Optional[SC] = None
+_shared_sc_with_lang = False
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        cls.sc = startup(
+
+def _get_shared_sc(start_sclang: bool) -> SC:
+    """Get the SC instance shared by the SCBaseTest classes.
+
+    The instance is only restarted when the sclang requirement changes.
+    """
+    global _shared_sc, _shared_sc_with_lang
+    if _shared_sc is not None and _shared_sc_with_lang != start_sclang:
+        _exit_shared_sc()
+    if _shared_sc is None:
+        _shared_sc = startup(
             start_server=True,
             scsynth_options=ServerOptions(
                 udp_port=57777,  # randrange(57777, 58888), # can be useful for debugging tests
                 max_logins=3,
             ),
             with_blip=False,
-            start_sclang=cls.start_sclang,
+            start_sclang=start_sclang,
         )
-        cls.sc.server.dump_osc(1)
+        _shared_sc_with_lang = start_sclang
         # ensure we get all warnings
-        cls.sc.server._max_warning_freq = float("-inf")
+        _shared_sc.server._max_warning_freq = float("-inf")
+    return _shared_sc
+
+
+def _exit_shared_sc() -> None:
+    global _shared_sc
+    if _shared_sc is not None:
+        try:
+            _shared_sc.exit()
+        finally:
+            _shared_sc = None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_sc_session():
+    yield
+    _exit_shared_sc()
+
+
+@pytest.fixture
+def without_shared_sc():
+    """For tests that start their own scsynth or SC instance."""
+    _exit_shared_sc()
+
+
+class SCBaseTest(TestCase):
+    __test__ = False
+    sc = None
+    start_sclang = False
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sc = _get_shared_sc(cls.start_sclang)
         assert cls.sc.server.sync(), "Syncing scsynth failed"
         if cls.start_sclang:
             cls.sc.server.mute()
@@ -58,4 +96,6 @@ class SCBaseTest(TestCase):
 
     @classmethod
     def tearDownClass(cls) -> None:
-        cls.sc.exit()
+        # reset the shared server instead of shutting it down
+        cls.sc.server.free_all()
+        cls.sc.server.sync()
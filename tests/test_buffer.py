@@ -10,7 +10,15 @@ class BufferTest(SCBaseTest):
     def setUp(self) -> None:
         self.buffer = Buffer()
 
+    def tearDown(self) -> None:
+        # the server is shared between test classes
+        if self.buffer.allocated:
+            self.buffer.free()
+
     def test_load_data(self):
-        bufdata = np.random.rand(30000, 1)
+        # scsynth stores float32 samples, which makes the round trip lossless
+        bufdata = np.random.rand(30000, 1).astype(np.float32)
         self.buffer.load_data(bufdata)
-        self.assertTrue(np.allclose(self.buffer.to_array(), bufdata))
+        self.assertTrue(
+            np.array_equal(self.buffer.to_array().astype(np.float32), bufdata)
+        )
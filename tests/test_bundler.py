@@ -1,5 +1,7 @@
 import time
 
+from pythonosc.osc_bundle import OscBundle
+
 from sc3nb import Synth
 from sc3nb.osc.osc_communication import Bundler
 from tests.conftest import SCBaseTest
@@ -43,6 +45,14 @@ class BundlerTest(SCBaseTest):
         self.assertEqual(server_bundle, bundle)
         self.assertEqual(server_auto_bundle, bundle)
 
+    def test_raw_osc(self):
+        with Bundler(timetag=1.0, send_on_exit=False) as bundler:
+            bundler.add(0.0, "/status")
+            bundler.add(0.5, "/s_new", ["s1", -1])
+        osc_bundle = OscBundle(bundler.to_raw_osc(start_time=0))
+        self.assertEqual(osc_bundle.num_contents, 2)
+        self.assertEqual([content.timestamp for content in osc_bundle], [1.0, 1.5])
+
     def test_bundler_messages(self):
         start = 2
         stop = 7
@@ -1,9 +1,12 @@
 from unittest import TestCase
 
+import pytest
+
 from sc3nb.sc import startup
 from sc3nb.sc_objects.server import ServerOptions
 
 
+@pytest.mark.usefixtures("without_shared_sc")
 class SCTest(TestCase):
     def test_start_scsynth(self):
         options = ServerOptions(udp_port=57777)
@@ -1,8 +1,10 @@
+from pathlib import PurePosixPath
 from unittest import TestCase
 
 import numpy as np
 
-from sc3nb.sclang import SCLang, SynthArgument
+from sc3nb.sclang import SCLang, SynthArgument, _clean_code, _load_synthdefs_code
+from sc3nb.util import replace_vars
 from tests.conftest import SCBaseTest
 
 
@@ -18,6 +20,33 @@ class SCLangTest(TestCase):
         self.assertTrue(self.sclang.started)
 
 
+class CleanCodeTest(TestCase):
+    def test_keeps_comment_markers_in_strings(self):
+        code = """ "http://sc3nb /* x */".postln; // comment
+        'it//s' """
+        self.assertEqual(
+            _clean_code(code), """"http://sc3nb /* x */".postln; 'it//s'"""
+        )
+
+    def test_keeps_escaped_quotes_in_strings(self):
+        code = replace_vars("x = ^v; x.postln; // comment", {"v": 'url: "http://x"'})
+        self.assertEqual(_clean_code(code), r'x = "url: \"http://x\""; x.postln;')
+        self.assertEqual(_clean_code(r"""'it\'s //' // comment"""), r"""'it\'s //'""")
+
+    def test_load_synthdefs_code_escapes_path(self):
+        code = _clean_code(_load_synthdefs_code(PurePosixPath(r'/tmp/a "b"\c')))
+        self.assertIn(r'PathName.new("/tmp/a \"b\"\\c")', code)
+
+    def test_removes_comments_and_whitespace(self):
+        code = """
+        a = 1;  /* multi
+        line */ b = 2; // end
+        // only comment
+        "two
+          lines".postln;"""
+        self.assertEqual(_clean_code(code), 'a = 1; b = 2; "two lines".postln;')
+
+
 class SCLangPersistentTest(SCBaseTest):
     __test__ = True
     start_sclang = True
@@ -106,6 +135,13 @@ class SCLangPersistentTest(SCBaseTest):
         self.assertIsInstance(sc_val, list)
         self.assertEqual(sc_val, pylist)
 
+    def test_cmd_batch(self):
+        c = 3
+        sc_val = self.sc.lang.cmd_batch(
+            ["a = 1 // first", "b = 2;", "a + b + ^c"], get_result=True
+        )
+        self.assertEqual(sc_val, 6)
+
     def test_get_synth_desc(self):
         expected_synth_desc = {
             "out": SynthArgument("out", "scalar", 0.0),
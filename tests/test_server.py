@@ -1,9 +1,12 @@
 from unittest import TestCase
 
+import pytest
+
 from sc3nb.sc_objects.node import Group
 from sc3nb.sc_objects.server import SCServer, ServerOptions
 
 
+@pytest.mark.usefixtures("without_shared_sc")
 class ServerTest(TestCase):
     def setUp(self) -> None:
         self.port = 57777
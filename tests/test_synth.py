@@ -1,10 +1,64 @@
 import time
 import warnings
+from unittest import TestCase
 
 from sc3nb.sc_objects.node import Synth, SynthInfo
+from sc3nb.sc_objects.synthdef import SynthDef
 from tests.conftest import SCBaseTest
 
 
+class SynthDefContextTest(TestCase):
+    def test_nested_context(self):
+        synth_def = SynthDef("x", "{ Out.ar(0, {{sig}}) }")
+        synth_def.set_context("sig", "SinOsc.ar({{freq}})").set_context("freq", 440)
+        self.assertEqual(synth_def.current_def, "{ Out.ar(0, SinOsc.ar(440)) }")
+
+    def test_nested_contexts(self):
+        synth_def = SynthDef("x", "{ Out.ar(0, {{sig}}) }")
+        synth_def.set_contexts({"sig": "SinOsc.ar({{freq}})", "freq": 440})
+        self.assertEqual(synth_def.current_def, "{ Out.ar(0, SinOsc.ar(440)) }")
+
+    def test_first_context_wins(self):
+        synth_def = SynthDef("x", "{{freq}} {{amp}}")
+        synth_def.set_context("freq", 440).set_context("freq", 220)
+        self.assertEqual(synth_def.current_def, "440 {{amp}}")
+        self.assertEqual(synth_def.unset_remaining().current_def, "440 ")
+
+
+class SynthDescCacheTest(TestCase):
+    class FakeLang:
+        def __init__(self, desc=None):
+            self.desc = desc
+            self.calls = 0
+
+        def get_synth_description(self, name):
+            self.calls += 1
+            if self.desc is None:
+                raise ValueError(name)
+            return self.desc
+
+    def tearDown(self) -> None:
+        SynthDef.invalidate_descriptions()
+
+    def test_retry_after_invalidating_unknown(self):
+        with self.assertWarnsRegex(UserWarning, "SynthDesc 'x' is unknown"):
+            self.assertIsNone(SynthDef.get_description("x", lang=self.FakeLang()))
+        lang = self.FakeLang(desc={"freq": None})
+        with self.assertWarnsRegex(UserWarning, "SynthDesc 'x' is unknown"):
+            self.assertIsNone(SynthDef.get_description("x", lang=lang))
+        self.assertEqual(lang.calls, 0)
+        SynthDef.invalidate_descriptions(only_unknown=True)
+        self.assertEqual(SynthDef.get_description("x", lang=lang), {"freq": None})
+        self.assertEqual(lang.calls, 1)
+
+    def test_invalidating_unknown_keeps_known(self):
+        lang = self.FakeLang(desc={"freq": None})
+        SynthDef.get_description("x", lang=lang)
+        SynthDef.invalidate_descriptions(only_unknown=True)
+        SynthDef.get_description("x", lang=lang)
+        self.assertEqual(lang.calls, 1)
+
+
 class SynthTest(SCBaseTest):
     __test__ = True
 
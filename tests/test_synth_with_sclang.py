@@ -1,6 +1,7 @@
 import time
 
 from sc3nb.sc_objects.node import Synth
+from sc3nb.sc_objects.synthdef import SynthDef
 from tests.conftest import SCBaseTest
 
 
@@ -27,3 +28,57 @@ class SynthTestWithSClang(SCBaseTest):
     def test_getattr(self):
         for name, value in self.all_synth_args.items():
             self.assertAlmostEqual(self.synth.__getattr__(name), value)
+
+    def test_add_many(self):
+        amp = 0.1
+        synth_defs = [
+            SynthDef(
+                f"sc3nb_test_many{i}",
+                r"""{ |out, freq = 440| Out.ar(out, SinOsc.ar(freq, 0, ^amp)) }""",
+            )
+            for i in range(3)
+        ]
+        names = SynthDef.add_many(synth_defs)
+        self.assertEqual(names, [synth_def.name for synth_def in synth_defs])
+        for name in names:
+            self.assertIn(name, SynthDef.synth_defs)
+            self.assertIsNotNone(SynthDef.get_description(name))
+
+    def test_send_large_synthdef_from_file(self):
+        direct_send_max = SynthDef.direct_send_max
+        SynthDef.direct_send_max = 0
+        try:
+            name = SynthDef(
+                "sc3nb_test_from_file",
+                r"""{ |out, freq = 440| Out.ar(out, SinOsc.ar(freq)) }""",
+            ).add()
+        finally:
+            SynthDef.direct_send_max = direct_send_max
+        synth = Synth(name, controls={"freq": 220})
+        self.assertAlmostEqual(synth.get("freq"), 220)
+        synth.free()
+
+    def test_resend_after_sclang_add(self):
+        definition = r"""{ |out, freq = 440| Out.ar(out, SinOsc.ar(freq, 0, 0)) }"""
+        name = SynthDef("sc3nb_test_resend", definition).add()
+        # replace the SynthDef on the server from sclang
+        SynthTestWithSClang.sc.lang.cmd(
+            f"""SynthDef("{name}", {{ |out, freq = 220| Out.ar(out) }}).add;""",
+            pyvars={},
+        )
+        SynthTestWithSClang.sc.server.sync()
+        SynthDef(name, definition).add()
+        synth = Synth(name)
+        self.assertAlmostEqual(synth.get("freq"), 440)
+        synth.free()
+
+    def test_resend_after_raw_free(self):
+        definition = r"""{ |out, freq = 440| Out.ar(out, SinOsc.ar(freq, 0, 0)) }"""
+        name = SynthDef("sc3nb_test_raw_free", definition).add()
+        # remove the SynthDef from the server without telling sc3nb
+        SynthTestWithSClang.sc.server.msg("/d_free", name)
+        SynthTestWithSClang.sc.server.sync()
+        SynthDef(name, definition).add()
+        synth = Synth(name)
+        self.assertAlmostEqual(synth.get("freq"), 440)
+        synth.free()
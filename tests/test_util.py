@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from sc3nb.util import convert_to_sc, parse_pyvars, replace_vars
+
+global_var = "global"
+
+
+class ParsePyvarsTest(TestCase):
+    def test_local_variable(self):
+        def resolve():
+            local_var = 42
+            return parse_pyvars("^local_var + ^global_var", frame_nr=1)
+
+        self.assertEqual(resolve(), {"local_var": 42, "global_var": "global"})
+
+    def test_local_shadows_global(self):
+        global_var = 1.5
+        pyvars = parse_pyvars("^global_var", frame_nr=1)
+        self.assertEqual(pyvars, {"global_var": global_var})
+
+    def test_replace_local_variable(self):
+        def build():
+            num_channels = 2
+            code = "Out.ar(0, In.ar(0, ^num_channels))"
+            return replace_vars(code, parse_pyvars(code, frame_nr=1))
+
+        self.assertEqual(build(), "Out.ar(0, In.ar(0, 2))")
+
+    def test_missing_variable(self):
+        with self.assertRaisesRegex(NameError, "not_defined_var"):
+            parse_pyvars("^not_defined_var", frame_nr=1)
+
+
+class ConvertToSCTest(TestCase):
+    def test_string_with_quotes(self):
+        self.assertEqual(convert_to_sc('say "hi"'), r'"say \"hi\""')
+
+    def test_string_with_backslashes(self):
+        self.assertEqual(convert_to_sc("\\x"), r'"\\x"')
+        self.assertEqual(convert_to_sc(r"C:\temp\new"), r'"C:\\temp\\new"')
+        self.assertEqual(convert_to_sc(r"a\"b"), r'"a\\\"b"')
+
+    def test_symbol(self):
+        self.assertEqual(convert_to_sc(r"\\symbol"), r"'\symbol'")
+
+    def test_escaped_symbol_prefix(self):
+        # the first backslash escapes the symbol prefix, the string keeps the rest
+        self.assertEqual(convert_to_sc(r"\\\\symbol"), r'"\\\\\\symbol"')
+
+    def test_sc_code(self):
+        self.assertEqual(convert_to_sc("sc3:Pseq([1, 2])"), "Pseq([1, 2])")
+
+    def test_replace_vars_with_string(self):
+        code = replace_vars("^text.postln", {"text": r'a "b" \ c'})
+        self.assertEqual(code, r'"a \"b\" \\ c".postln')
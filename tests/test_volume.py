@@ -50,3 +50,21 @@ class VolumeTest(SCBaseTest):
         del vol_synth
         self.assertFalse(VolumeTest.sc.server.muted)
         self.assertIsNone(VolumeTest.sc.server._volume._synth)
+
+    def test_free_all_while_muted(self):
+        VolumeTest.sc.server.muted = True
+        vol_synth = VolumeTest.sc.server._volume._synth
+        self.assertIsNotNone(vol_synth)
+        VolumeTest.sc.server.free_all()
+        vol_synth.wait(timeout=1)
+        new_vol_synth = VolumeTest.sc.server._volume._synth
+        self.assertIsNot(vol_synth, new_vol_synth)
+        self.assertIn(new_vol_synth, VolumeTest.sc.server.query_tree().children)
+        self.assertAlmostEqual(0, new_vol_synth.get("volumeAmp"))
+        VolumeTest.sc.server.muted = False
+        new_vol_synth.wait(timeout=0.2)
+        del vol_synth, new_vol_synth
+        self.assertIsNone(VolumeTest.sc.server._volume._synth)
+        # recreate the Synth freed by free_all for tearDown
+        self.synth.wait(timeout=1)
+        self.synth.new()